@@ -6,17 +6,24 @@ Renames folders based on RJ number to Japanese title from CSV export.
 Handles multi-part folders and Windows filename restrictions.
 """
 
+import atexit
 import csv
 import json
 import logging
 import os
+import queue
 import re
+import stat
 import sys
 import time
 import unicodedata
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterable, Iterator, List, Tuple, Optional
 
 
 # ============================================================================
@@ -29,6 +36,13 @@ class Config:
     LOG_DIR = 'logs'
     DEFAULT_CSV = 'dlsite_purchases.csv'
 
+    # Parallel execution (rename/utime syscalls release the GIL)
+    MAX_WORKERS = min(32, (os.cpu_count() or 4) * 2)
+    PARALLEL_THRESHOLD = 32  # Run sequentially below this many operations
+
+    # Optional pyarrow CSV parser: only worth its import time on large files
+    ARROW_MIN_CSV_BYTES = 16 * 1024 * 1024
+
     # Character replacements (full-width equivalents)
     CHAR_REPLACEMENTS = {
         '<': '＜',   # Full-width less than
@@ -43,6 +57,13 @@ class Config:
     }
 
 
+# Translation table for Config.CHAR_REPLACEMENTS (single pass in str.translate)
+_CHAR_TRANSLATION = str.maketrans(Config.CHAR_REPLACEMENTS)
+
+# Trailing .partN suffix of multi-part folders (e.g. RJ243414.part1)
+_PART_SUFFIX_RE = re.compile(r'(\.part\d+)$', re.IGNORECASE)
+
+
 # ============================================================================
 # Exceptions
 # ============================================================================
@@ -98,14 +119,19 @@ def setup_logging(log_dir: str = Config.LOG_DIR,
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     log_file = log_path / f'rename_{timestamp}.log'
 
+    # File output runs on a background listener thread so that per-operation
+    # logging does not block the renaming loop. Console output stays synchronous
+    # so log lines keep their order relative to the preview and the prompt.
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, logging.FileHandler(log_file, encoding='utf-8'))
+    listener.start()
+    atexit.register(listener.stop)  # Flush remaining records on exit
+
     # Configure logging
     logging.basicConfig(
         level=level,
         format='%(asctime)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_file, encoding='utf-8'),
-            logging.StreamHandler()
-        ]
+        handlers=[QueueHandler(log_queue), logging.StreamHandler()]
     )
 
     new_logger = logging.getLogger(__name__)
@@ -114,6 +140,117 @@ def setup_logging(log_dir: str = Config.LOG_DIR,
     return new_logger
 
 
+def _read_csv_columns_arrow(csv_path: Path,
+                            has_purchase_date: bool) -> Optional[Tuple[List[str], List[str], List[str]]]:
+    """
+    Read CSV columns with pyarrow's multi-threaded C++ parser
+
+    pyarrow is optional and imported here, so runs that never reach this
+    path (small CSVs, --help) do not pay for the import.
+
+    Args:
+        csv_path: Path to CSV file
+        has_purchase_date: Whether the CSV has a purchase_date column
+
+    Returns:
+        Tuple of (rj_numbers, titles, purchase_dates) lists, or None if
+        pyarrow is not installed or cannot parse the file (e.g. ragged rows)
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+    except ImportError:
+        return None
+
+    names = ['rj_number', 'title']
+    if has_purchase_date:
+        names.append('purchase_date')
+
+    # Force string columns so dates/numbers are not type-inferred
+    try:
+        table = pa_csv.read_csv(
+            csv_path,
+            convert_options=pa_csv.ConvertOptions(
+                column_types={name: pa.string() for name in names},
+                include_columns=names
+            )
+        )
+    except pa.ArrowInvalid as e:
+        logger.debug(f"pyarrow could not parse CSV, using csv module: {e}")
+        return None
+
+    rj_numbers = table.column('rj_number').to_pylist()
+    titles = table.column('title').to_pylist()
+    if has_purchase_date:
+        purchase_dates = table.column('purchase_date').to_pylist()
+    else:
+        purchase_dates = [''] * table.num_rows
+
+    return rj_numbers, titles, purchase_dates
+
+
+def _read_csv_columns(csv_path: Path) -> Tuple[List[str], List[str], List[str]]:
+    """
+    Read rj_number, title and purchase_date columns from CSV
+
+    Large regular files (Config.ARROW_MIN_CSV_BYTES and up) are parsed with
+    pyarrow when it is installed; everything else, or anything pyarrow
+    rejects, goes through the standard csv module.
+
+    Args:
+        csv_path: Path to CSV file
+
+    Returns:
+        Tuple of (rj_numbers, titles, purchase_dates) lists of raw strings
+
+    Raises:
+        ValueError: If a required column is missing from the header
+    """
+    # Use 'utf-8-sig' to automatically handle BOM
+    with open(csv_path, 'r', encoding='utf-8-sig') as f:
+        reader = csv.reader(f)
+
+        header = next(reader, None)
+        if header is None:
+            return [], [], []
+
+        # Resolve column positions once instead of building a dict per row
+        columns = {name: i for i, name in enumerate(header)}
+        try:
+            rj_index = columns['rj_number']
+            title_index = columns['title']
+        except KeyError as e:
+            raise ValueError(f"Missing required column in CSV header: {e}")
+        date_index = columns.get('purchase_date')
+
+        # Duplicate header names are left to the csv module, which (like
+        # csv.DictReader) uses the last column of that name
+        file_stat = os.fstat(f.fileno())
+        if (stat.S_ISREG(file_stat.st_mode)
+                and file_stat.st_size >= Config.ARROW_MIN_CSV_BYTES
+                and len(columns) == len(header)):
+            arrow_columns = _read_csv_columns_arrow(csv_path, date_index is not None)
+            if arrow_columns is not None:
+                return arrow_columns
+
+        rj_numbers = []
+        titles = []
+        purchase_dates = []
+        width = len(header)
+
+        # Blank lines are skipped (same as csv.DictReader)
+        for row in filter(None, reader):
+            # Pad short rows so missing fields read as empty
+            if len(row) < width:
+                row += [''] * (width - len(row))
+
+            rj_numbers.append(row[rj_index])
+            titles.append(row[title_index])
+            purchase_dates.append(row[date_index] if date_index is not None else '')
+
+    return rj_numbers, titles, purchase_dates
+
+
 def load_renaming_map(csv_path: Path) -> Dict[str, Tuple[str, Optional[str]]]:
     """
     Load CSV and create rj_number -> (title, purchase_date) mapping
@@ -126,29 +263,29 @@ def load_renaming_map(csv_path: Path) -> Dict[str, Tuple[str, Optional[str]]]:
     """
     renaming_map = {}
 
-    # Use 'utf-8-sig' to automatically handle BOM
-    with open(csv_path, 'r', encoding='utf-8-sig') as f:
-        reader = csv.DictReader(f)
+    rj_numbers, titles, purchase_dates = _read_csv_columns(csv_path)
 
-        for row_num, row in enumerate(reader, start=2):  # Start at 2 (1 is header)
-            rj_number = row.get('rj_number', '').strip()
-            title = row.get('title', '').strip()
-            purchase_date = row.get('purchase_date', '').strip()
+    rows = zip(rj_numbers, titles, purchase_dates)
+    for row_num, (rj_number, title, purchase_date) in enumerate(rows, start=2):  # Start at 2 (1 is header)
+        rj_number = rj_number.strip()
+        title = title.strip()
+        purchase_date = purchase_date.strip()
 
-            # Validate data
-            if not rj_number:
-                logger.warning(f"Row {row_num}: Missing rj_number, skipping")
-                continue
+        # Validate data
+        if not rj_number:
+            logger.warning(f"Row {row_num}: Missing rj_number, skipping")
+            continue
 
-            if not title:
-                logger.warning(f"Row {row_num}: Missing title for {rj_number}, skipping")
-                continue
+        if not title:
+            logger.warning(f"Row {row_num}: Missing title for {rj_number}, skipping")
+            continue
 
-            renaming_map[rj_number] = (title, purchase_date if purchase_date else None)
+        renaming_map[rj_number] = (title, purchase_date if purchase_date else None)
 
     return renaming_map
 
 
+@lru_cache(maxsize=16384)
 def sanitize_filename(title: str,
                      max_length: int = Config.MAX_FILENAME_LENGTH) -> str:
     """
@@ -170,14 +307,13 @@ def sanitize_filename(title: str,
     Raises:
         ValueError: If title becomes empty after sanitization
     """
-    sanitized = title
-
     # Replace forbidden characters
-    for char, replacement in Config.CHAR_REPLACEMENTS.items():
-        sanitized = sanitized.replace(char, replacement)
+    sanitized = title.translate(_CHAR_TRANSLATION)
 
     # Normalize Unicode (NFC form for compatibility)
-    sanitized = unicodedata.normalize('NFC', sanitized)
+    # ASCII is always NFC; otherwise the quick check avoids a full normalize
+    if not sanitized.isascii() and not unicodedata.is_normalized('NFC', sanitized):
+        sanitized = unicodedata.normalize('NFC', sanitized)
 
     # Remove leading/trailing whitespace
     sanitized = sanitized.strip()
@@ -196,6 +332,33 @@ def sanitize_filename(title: str,
     return sanitized
 
 
+@lru_cache(maxsize=4096)
+def _purchase_date_to_timestamp(date_str: str) -> float:
+    """
+    Convert purchase date string to Unix timestamp (local midnight)
+
+    Args:
+        date_str: Date string in format "YYYY/MM/DD HH:MM"
+
+    Returns:
+        Unix timestamp for the date at 00:00:00
+
+    Raises:
+        ValueError: If date_str is not a valid date
+    """
+    # Fast path: slice the fixed-width format ("2019/01/21 21:56") directly
+    if (len(date_str) == 16 and date_str[4] == '/' and date_str[7] == '/'
+            and date_str[10] == ' ' and date_str[13] == ':'):
+        dt = datetime(int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]),
+                      int(date_str[11:13]), int(date_str[14:16]))
+    else:
+        # Non-padded variants (e.g. "2021/1/5 9:00") go through strptime
+        dt = datetime.strptime(date_str, '%Y/%m/%d %H:%M')
+
+    # Set time to midnight (00:00:00) and convert to Unix timestamp
+    return dt.replace(hour=0, minute=0).timestamp()
+
+
 def parse_purchase_date(date_str: str) -> Optional[float]:
     """
     Parse purchase date from CSV and convert to Unix timestamp (midnight)
@@ -210,21 +373,33 @@ def parse_purchase_date(date_str: str) -> Optional[float]:
         return None
 
     try:
-        # Parse the date string (format: "2019/01/21 21:56")
-        dt = datetime.strptime(date_str, '%Y/%m/%d %H:%M')
-
-        # Set time to midnight (00:00:00)
-        dt_midnight = dt.replace(hour=0, minute=0, second=0, microsecond=0)
-
-        # Convert to Unix timestamp
-        timestamp = dt_midnight.timestamp()
-
-        return timestamp
+        # Purchase dates repeat heavily, so conversions are cached
+        return _purchase_date_to_timestamp(date_str)
     except ValueError as e:
         logger.warning(f"Failed to parse purchase date '{date_str}': {e}")
         return None
 
 
+def _matches_name_or_part(name_lower: str, key_lower: str) -> bool:
+    """
+    Check if a lowercased folder name is key or key.partN
+
+    Args:
+        name_lower: Lowercased folder name
+        key_lower: Lowercased RJ number or title to match
+
+    Returns:
+        True if the folder name matches
+    """
+    if name_lower == key_lower:
+        return True
+
+    # Plain string comparison instead of a per-key regex: key + '.part' + digits
+    prefix = key_lower + '.part'
+    return (name_lower.startswith(prefix)
+            and name_lower[len(prefix):].isdecimal())
+
+
 def find_matching_folders(base_dir: Path, rj_number: str) -> List[Path]:
     """
     Find folders matching rj_number or rj_number.partN pattern
@@ -238,18 +413,21 @@ def find_matching_folders(base_dir: Path, rj_number: str) -> List[Path]:
     """
     matching_folders = []
 
-    # Pattern: exact match or with .partN suffix
+    # Exact match or with .partN suffix
     # Example: RJ243414 or RJ243414.part1, RJ243414.part2
-    pattern = re.compile(rf'^{re.escape(rj_number)}(\.part\d+)?$', re.IGNORECASE)
+    key = rj_number.lower()
 
     # Search in base directory
     if not base_dir.exists():
         logger.error(f"Base directory does not exist: {base_dir}")
         return []
 
-    for item in base_dir.iterdir():
-        if item.is_dir() and pattern.match(item.name):
-            matching_folders.append(item)
+    # Match on the name first (lowercased once per entry); DirEntry.is_dir()
+    # uses the cached file type and Path objects are only built for matches
+    with os.scandir(base_dir) as entries:
+        for entry in entries:
+            if _matches_name_or_part(entry.name.lower(), key) and entry.is_dir():
+                matching_folders.append(Path(entry.path))
 
     return sorted(matching_folders)  # Sort for consistent ordering
 
@@ -267,12 +445,12 @@ def find_matching_folders_from_cache(folder_cache: Dict[str, Path], rj_number: s
     """
     matching_folders = []
 
-    # Pattern: exact match or with .partN suffix
+    # Exact match or with .partN suffix
     # Example: RJ243414 or RJ243414.part1, RJ243414.part2
-    pattern = re.compile(rf'^{re.escape(rj_number)}(\.part\d+)?$', re.IGNORECASE)
+    key = rj_number.lower()
 
     for folder_name, folder_path in folder_cache.items():
-        if pattern.match(folder_name):
+        if _matches_name_or_part(folder_name.lower(), key):
             matching_folders.append(folder_path)
 
     return sorted(matching_folders)  # Sort for consistent ordering
@@ -291,18 +469,21 @@ def find_folders_by_title(base_dir: Path, sanitized_title: str) -> List[Path]:
     """
     matching_folders = []
 
-    # Pattern: exact match or with .partN suffix
+    # Exact match or with .partN suffix
     # Example: タイトル or タイトル.part1, タイトル.part2
-    pattern = re.compile(rf'^{re.escape(sanitized_title)}(\.part\d+)?$', re.IGNORECASE)
+    key = sanitized_title.lower()
 
     # Search in base directory
     if not base_dir.exists():
         logger.error(f"Base directory does not exist: {base_dir}")
         return []
 
-    for item in base_dir.iterdir():
-        if item.is_dir() and pattern.match(item.name):
-            matching_folders.append(item)
+    # Match on the name first (lowercased once per entry); DirEntry.is_dir()
+    # uses the cached file type and Path objects are only built for matches
+    with os.scandir(base_dir) as entries:
+        for entry in entries:
+            if _matches_name_or_part(entry.name.lower(), key) and entry.is_dir():
+                matching_folders.append(Path(entry.path))
 
     return sorted(matching_folders)  # Sort for consistent ordering
 
@@ -320,25 +501,109 @@ def find_folders_by_title_from_cache(folder_cache: Dict[str, Path], sanitized_ti
     """
     matching_folders = []
 
-    # Pattern: exact match or with .partN suffix
+    # Exact match or with .partN suffix
     # Example: タイトル or タイトル.part1, タイトル.part2
-    pattern = re.compile(rf'^{re.escape(sanitized_title)}(\.part\d+)?$', re.IGNORECASE)
+    key = sanitized_title.lower()
 
     for folder_name, folder_path in folder_cache.items():
-        if pattern.match(folder_name):
+        if _matches_name_or_part(folder_name.lower(), key):
             matching_folders.append(folder_path)
 
     return sorted(matching_folders)  # Sort for consistent ordering
 
 
+def _index_dir(base_dir: Path) -> Dict[str, List[Tuple[str, Optional[str]]]]:
+    """
+    Scan base directory once and index folders for case-insensitive lookup
+
+    Each folder is indexed under its lowercased name and, for multi-part
+    folders, also under the lowercased name without the .partN suffix, so
+    both RJ number and title lookups become a single dict access.
+
+    Args:
+        base_dir: Base directory to scan
+
+    Returns:
+        Dictionary mapping lowercased key to sorted list of
+        (folder_path, part_suffix) tuples (suffix is None if absent);
+        paths are plain strings to avoid per-folder Path allocations
+    """
+    index = {}
+
+    with os.scandir(base_dir) as entries:
+        for entry in entries:
+            # DirEntry.is_dir() uses the cached file type when available
+            if not entry.is_dir():
+                continue
+
+            name = entry.name
+            name_lower = name.lower()
+
+            # Extract the .partN suffix once here instead of per plan entry
+            suffix_match = _PART_SUFFIX_RE.search(name)
+            suffix = suffix_match.group(1) if suffix_match else None
+
+            folder = (entry.path, suffix)
+            index.setdefault(name_lower, []).append(folder)
+
+            # Example: RJ243414.part1 is also reachable via "rj243414"
+            if suffix_match:
+                stem_lower = name[:suffix_match.start()].lower()
+                if stem_lower != name_lower:
+                    index.setdefault(stem_lower, []).append(folder)
+
+    # Sort once for consistent ordering (paths are unique within a key)
+    for folders in index.values():
+        folders.sort()
+
+    return index
+
+
+def sanitize_titles(renaming_map: Dict[str, Tuple[str, Optional[str]]],
+                    max_length: int = Config.MAX_FILENAME_LENGTH) -> Dict[str, str]:
+    """
+    Sanitize all CSV titles in one pass
+
+    Done right after loading the CSV so the plan loop only does lookups
+    and path joins.
+
+    Args:
+        renaming_map: Dictionary of rj_number -> (title, purchase_date)
+        max_length: Maximum filename length
+
+    Returns:
+        Dictionary of rj_number -> sanitized title (failed titles omitted)
+    """
+    sanitized_titles = {}
+    sanitization_errors = []
+
+    sanitize = sanitize_filename  # Local lookup in the loop
+    for rj_number, (title, _) in renaming_map.items():
+        try:
+            sanitized_titles[rj_number] = sanitize(title, max_length)
+        except ValueError as e:
+            logger.error(f"Failed to sanitize title for {rj_number}: {e}")
+            sanitization_errors.append(rj_number)
+
+    if sanitization_errors:
+        logger.warning(f"Sanitization errors for {len(sanitization_errors)} RJ numbers")
+
+    return sanitized_titles
+
+
 def generate_renaming_plan(base_dir: Path,
                           renaming_map: Dict[str, Tuple[str, Optional[str]]],
                           max_length: int = Config.MAX_FILENAME_LENGTH,
                           remove_suffix: bool = False,
                           update_mtime: bool = False,
-                          include_renamed: bool = False) -> List[Tuple[Path, Path, Optional[float]]]:
+                          include_renamed: bool = False,
+                          sanitized_titles: Optional[Dict[str, str]] = None) -> Iterator[Tuple[str, str, Optional[float]]]:
     """
-    Generate complete renaming plan
+    Generate renaming plan lazily
+
+    Entries are yielded as soon as each RJ number is resolved, so callers
+    can consume them while the CSV is still being matched. Summary
+    counters are logged once the generator is exhausted.
 
     Args:
         base_dir: Base directory containing folders
@@ -347,110 +612,100 @@ def generate_renaming_plan(base_dir: Path,
         remove_suffix: If True, remove .partN suffix when only one folder exists for an RJ number
         update_mtime: If True, update modification time to purchase date
         include_renamed: If True, also find already-renamed folders for renaming
+        sanitized_titles: Result of sanitize_titles(); computed here if None
 
-    Returns:
-        List of (old_path, new_path, timestamp) tuples
+    Yields:
+        (old_path, new_path, timestamp) tuples with str paths
     """
-    plan = []
     not_found = []
-    sanitization_errors = []
 
-    # OPTIMIZATION: Scan directory once and cache all folder names
-    # This eliminates redundant directory scans for each RJ number
-    logger.debug("Building folder cache...")
-    folder_cache = {}
+    # OPTIMIZATION: Scan directory once and index all folder names
+    # Each RJ number / title lookup is then a dict access instead of a scan
+    logger.debug("Building folder index...")
     if base_dir.exists():
-        for item in base_dir.iterdir():
-            if item.is_dir():
-                folder_cache[item.name] = item
+        folder_index = _index_dir(base_dir)
     else:
         logger.error(f"Base directory does not exist: {base_dir}")
-        return []
-    logger.debug(f"Cached {len(folder_cache)} folders")
+        return
+    logger.debug(f"Indexed {len(folder_index)} folder keys")
 
-    for rj_number, (title, purchase_date) in renaming_map.items():
-        # Sanitize title
-        try:
-            sanitized_title = sanitize_filename(title, max_length)
-        except ValueError as e:
-            logger.error(f"Failed to sanitize title for {rj_number}: {e}")
-            sanitization_errors.append(rj_number)
-            continue
+    base_dir_str = os.fspath(base_dir)
 
-        # Parse purchase date
-        timestamp = parse_purchase_date(purchase_date) if purchase_date else None
+    if sanitized_titles is None:
+        sanitized_titles = sanitize_titles(renaming_map, max_length)
+
+    for rj_number, (_, purchase_date) in renaming_map.items():
+        # Titles that failed sanitization were already reported
+        sanitized_title = sanitized_titles.get(rj_number)
+        if sanitized_title is None:
+            continue
 
-        # Find matching folders (by RJ number) - using cache
-        matching_folders = find_matching_folders_from_cache(folder_cache, rj_number)
+        # Find matching folders (by RJ number) - using index
+        matching_folders = folder_index.get(rj_number.lower(), ())
 
         if not matching_folders and include_renamed:
             # If include_renamed is enabled, also search for already-renamed folders
             # This allows renaming/updating folders that have already been renamed
-            matching_folders = find_folders_by_title_from_cache(folder_cache, sanitized_title)
+            matching_folders = folder_index.get(sanitized_title.lower(), ())
 
         if not matching_folders:
             not_found.append(rj_number)
             logger.debug(f"No folder found for {rj_number}")
             continue
 
+        # Parse purchase date (only for RJ numbers that have folders)
+        timestamp = parse_purchase_date(purchase_date) if purchase_date else None
+
         # Determine if we should keep suffixes
         # Keep suffixes if multiple folders exist OR if remove_suffix is False
         has_multiple_parts = len(matching_folders) > 1
         keep_suffix = has_multiple_parts or not remove_suffix
 
-        # Generate rename operations for each match
-        for old_path in matching_folders:
-            # Preserve .partN suffix if present
-            suffix_match = re.search(r'(\.part\d+)$', old_path.name, re.IGNORECASE)
-            suffix = suffix_match.group(1) if suffix_match else None
-
-            # Generate new name with RJ number prefix
-            # Format: RJ番号_タイトル or RJ番号_タイトル.partN
-            if suffix and keep_suffix:
-                new_name = f"{rj_number}_{sanitized_title}{suffix}"
-            else:
-                new_name = f"{rj_number}_{sanitized_title}"
-
-            new_path = old_path.parent / new_name
-
-            plan.append((old_path, new_path, timestamp))
+        # New name with RJ number prefix, shared by all parts
+        base_name = f"{rj_number}_{sanitized_title}"
+
+        # Generate rename operations for all matches of this RJ number at once
+        # Preserve .partN suffix if present
+        # Format: RJ番号_タイトル or RJ番号_タイトル.partN
+        # Matching folders all live directly in base_dir
+        yield from [
+            (old_path,
+             os.path.join(base_dir_str, f"{base_name}{suffix}" if suffix and keep_suffix else base_name),
+             timestamp)
+            for old_path, suffix in matching_folders
+        ]
 
     # Report summary
     if not_found:
         logger.info(f"Folders not found for {len(not_found)} RJ numbers (this is normal if you don't have all items downloaded)")
 
-    if sanitization_errors:
-        logger.warning(f"Sanitization errors for {len(sanitization_errors)} RJ numbers")
-
-    return plan
 
-
-def check_for_duplicates(plan: List[Tuple[Path, Path, Optional[float]]]) -> Dict[str, List[Path]]:
+def check_for_duplicates(plan: Iterable[Tuple[str, str, Optional[float]]]) -> Dict[str, List[str]]:
     """
     Check for duplicate target names
 
     Args:
-        plan: List of (old_path, new_path, timestamp) tuples
+        plan: Iterable of (old_path, new_path, timestamp) tuples (consumed once)
 
     Returns:
         Dictionary of {target_name: [source_folders]} for duplicates
     """
-    targets = {}
+    targets = defaultdict(list)
+    duplicate_names = []
 
     for source, target, _ in plan:
-        target_name = target.name
-        if target_name not in targets:
-            targets[target_name] = []
-        targets[target_name].append(source)
+        target_name = os.path.basename(target)
+        sources = targets[target_name]
+        sources.append(source)
 
-    # Find duplicates
-    duplicates = {name: sources for name, sources in targets.items()
-                  if len(sources) > 1}
+        # Record duplicates while scanning (only on the first collision)
+        if len(sources) == 2:
+            duplicate_names.append(target_name)
 
-    return duplicates
+    return {name: targets[name] for name in duplicate_names}
 
 
-def preview_renaming(plan: List[Tuple[Path, Path, Optional[float]]],
+def preview_renaming(plan: List[Tuple[str, str, Optional[float]]],
                     output_format: str = 'table'):
     """
     Display preview of renaming operations
@@ -460,15 +715,19 @@ def preview_renaming(plan: List[Tuple[Path, Path, Optional[float]]],
         output_format: 'table' or 'json'
     """
     if output_format == 'table':
-        print("\n" + "="*80)
-        print("RENAMING PREVIEW")
-        print("="*80)
-        print(f"{'Old Name':<40} => {'New Name':<40}")
-        print("-"*80)
+        # Build the whole table and write it once instead of print() per row
+        lines = [
+            "",
+            "="*80,
+            "RENAMING PREVIEW",
+            "="*80,
+            f"{'Old Name':<40} => {'New Name':<40}",
+            "-"*80,
+        ]
 
         for old_path, new_path, _ in plan:
-            old_name = old_path.name
-            new_name = new_path.name
+            old_name = os.path.basename(old_path)
+            new_name = os.path.basename(new_path)
 
             # Truncate if too long for display
             if len(old_name) > 38:
@@ -476,27 +735,31 @@ def preview_renaming(plan: List[Tuple[Path, Path, Optional[float]]],
             if len(new_name) > 38:
                 new_name = new_name[:35] + "..."
 
-            print(f"{old_name:<40} => {new_name:<40}")
+            lines.append(f"{old_name:<40} => {new_name:<40}")
+
+        lines.append("="*80)
+        lines.append(f"Total operations: {len(plan)}")
+        lines.append("="*80 + "\n")
 
-        print("="*80)
-        print(f"Total operations: {len(plan)}")
-        print("="*80 + "\n")
+        sys.stdout.write("\n".join(lines) + "\n")
 
     elif output_format == 'json':
         preview = [
             {
-                'old': str(old_path),
-                'new': str(new_path),
-                'old_name': old_path.name,
-                'new_name': new_path.name,
+                'old': old_path,
+                'new': new_path,
+                'old_name': os.path.basename(old_path),
+                'new_name': os.path.basename(new_path),
                 'timestamp': timestamp
             }
             for old_path, new_path, timestamp in plan
         ]
-        print(json.dumps(preview, indent=2, ensure_ascii=False))
+        # Encode straight to stdout without building the full JSON string
+        json.dump(preview, sys.stdout, indent=2, ensure_ascii=False)
+        sys.stdout.write("\n")
 
 
-def confirm_execution(plan: List[Tuple[Path, Path, Optional[float]]]) -> bool:
+def confirm_execution(plan: List[Tuple[str, str, Optional[float]]]) -> bool:
     """
     Ask user to confirm before executing
 
@@ -513,7 +776,7 @@ def confirm_execution(plan: List[Tuple[Path, Path, Optional[float]]]) -> bool:
     return response in ['yes', 'y']
 
 
-def log_operation(old_path: Path, new_path: Path, success: bool, error: Optional[str] = None):
+def log_operation(old_path: str, new_path: str, success: bool, error: Optional[str] = None):
     """
     Log individual rename operation
 
@@ -523,86 +786,119 @@ def log_operation(old_path: Path, new_path: Path, success: bool, error: Optional
         success: Whether operation succeeded
         error: Error message if failed
     """
+    old_name = os.path.basename(old_path)
+    new_name = os.path.basename(new_path)
+
     if success:
         if old_path == new_path:
-            logger.info(f"SUCCESS (mtime only): {old_path.name}")
+            logger.info(f"SUCCESS (mtime only): {old_name}")
         else:
-            logger.info(f"SUCCESS: {old_path.name} => {new_path.name}")
+            logger.info(f"SUCCESS: {old_name} => {new_name}")
     else:
-        logger.error(f"FAILED: {old_path.name} => {new_path.name}")
+        logger.error(f"FAILED: {old_name} => {new_name}")
         if error:
             logger.error(f"  Error: {error}")
 
 
-def execute_renaming(plan: List[Tuple[Path, Path, Optional[float]]],
-                    dry_run: bool = False,
-                    update_mtime: bool = False) -> List[Tuple[Path, Path, bool, Optional[str]]]:
+def _execute_one(old_path: str,
+                 new_path: str,
+                 timestamp: Optional[float],
+                 dry_run: bool,
+                 update_mtime: bool) -> Tuple[str, str, bool, Optional[str]]:
     """
-    Execute renaming operations
+    Execute a single renaming operation
 
     Args:
-        plan: List of (old_path, new_path, timestamp) tuples
+        old_path: Original path
+        new_path: New path
+        timestamp: Purchase date timestamp (or None)
         dry_run: If True, don't actually rename
         update_mtime: If True, update folder modification time to purchase date
 
     Returns:
-        List of (old_path, new_path, success, error) tuples
+        (old_path, new_path, success, error) tuple
     """
-    results = []
-
-    for old_path, new_path, timestamp in plan:
+    try:
+        # Validation checks (one stat call for existence and type)
         try:
-            # Validation checks
-            if not old_path.exists():
-                raise FolderNotFoundError(f"Source not found: {old_path}")
-
-            if not old_path.is_dir():
-                raise RenamingError(f"Not a directory: {old_path}")
-
-            # Check if this is just a mtime update (no rename needed)
-            is_mtime_only = (old_path == new_path)
+            source_stat = os.stat(old_path)
+        except FileNotFoundError:
+            raise FolderNotFoundError(f"Source not found: {old_path}")
+
+        if not stat.S_ISDIR(source_stat.st_mode):
+            raise RenamingError(f"Not a directory: {old_path}")
+
+        # Check if this is just a mtime update (no rename needed)
+        is_mtime_only = (old_path == new_path)
+
+        # Kept explicit: on POSIX, rename() silently replaces an empty directory
+        if not is_mtime_only and os.path.exists(new_path):
+            raise TargetExistsError(f"Target already exists: {new_path}")
+
+        # No separate write permission check: rename() raises PermissionError itself
+
+        # Execute rename
+        if not dry_run:
+            if not is_mtime_only:
+                # rename() either succeeds or raises, so no follow-up exists() check
+                os.rename(old_path, new_path)
+
+            # Update modification time if requested and timestamp is available
+            # For mtime-only operations, update the old_path directly
+            target_path = new_path if not is_mtime_only else old_path
+            if update_mtime and timestamp is not None:
+                try:
+                    # Set both access time and modification time to the same timestamp
+                    os.utime(target_path, (timestamp, timestamp))
+                    # Date formatting only when debug output is actually enabled
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Updated mtime for %s to %s", os.path.basename(target_path),
+                                     datetime.fromtimestamp(timestamp).strftime('%Y-%m-%d'))
+                except Exception as e:
+                    logger.warning(f"Failed to update mtime for {os.path.basename(target_path)}: {e}")
+
+        # Log success
+        log_operation(old_path, new_path, True)
+        return old_path, new_path, True, None
 
-            if not is_mtime_only and new_path.exists():
-                raise TargetExistsError(f"Target already exists: {new_path}")
+    except Exception as e:
+        # Log failure
+        error_msg = str(e)
+        log_operation(old_path, new_path, False, error_msg)
+        return old_path, new_path, False, error_msg
 
-            # Check parent directory is writable (only if renaming)
-            if not is_mtime_only and not os.access(old_path.parent, os.W_OK):
-                raise PermissionError(f"No write permission: {old_path.parent}")
 
-            # Execute rename
-            if not dry_run:
-                if not is_mtime_only:
-                    old_path.rename(new_path)
+def execute_renaming(plan: List[Tuple[str, str, Optional[float]]],
+                    dry_run: bool = False,
+                    update_mtime: bool = False) -> List[Tuple[str, str, bool, Optional[str]]]:
+    """
+    Execute renaming operations
 
-                    # Verify
-                    if not new_path.exists():
-                        raise RenamingError("Verification failed: target not found after rename")
+    Large plans are run on a thread pool: rename/utime are blocking
+    syscalls that release the GIL, so their latency (notably on NAS/SMB)
+    overlaps across workers. Results keep the plan order.
 
-                # Update modification time if requested and timestamp is available
-                # For mtime-only operations, update the old_path directly
-                target_path = new_path if not is_mtime_only else old_path
-                if update_mtime and timestamp is not None:
-                    try:
-                        # Set both access time and modification time to the same timestamp
-                        os.utime(target_path, (timestamp, timestamp))
-                        logger.debug(f"Updated mtime for {target_path.name} to {datetime.fromtimestamp(timestamp).strftime('%Y-%m-%d')}")
-                    except Exception as e:
-                        logger.warning(f"Failed to update mtime for {target_path.name}: {e}")
+    Args:
+        plan: List of (old_path, new_path, timestamp) tuples
+        dry_run: If True, don't actually rename
+        update_mtime: If True, update folder modification time to purchase date
 
-            # Log success
-            log_operation(old_path, new_path, True)
-            results.append((old_path, new_path, True, None))
+    Returns:
+        List of (old_path, new_path, success, error) tuples
+    """
+    def run(entry: Tuple[str, str, Optional[float]]) -> Tuple[str, str, bool, Optional[str]]:
+        old_path, new_path, timestamp = entry
+        return _execute_one(old_path, new_path, timestamp, dry_run, update_mtime)
 
-        except Exception as e:
-            # Log failure
-            error_msg = str(e)
-            log_operation(old_path, new_path, False, error_msg)
-            results.append((old_path, new_path, False, error_msg))
+    # Thread startup is not worth it for small plans
+    if len(plan) < Config.PARALLEL_THRESHOLD:
+        return [run(entry) for entry in plan]
 
-    return results
+    with ThreadPoolExecutor(max_workers=Config.MAX_WORKERS) as executor:
+        return list(executor.map(run, plan))
 
 
-def generate_summary_report(results: List[Tuple[Path, Path, bool, Optional[str]]]):
+def generate_summary_report(results: List[Tuple[str, str, bool, Optional[str]]]):
     """
     Generate summary report after execution
 
@@ -624,7 +920,7 @@ def generate_summary_report(results: List[Tuple[Path, Path, bool, Optional[str]]
         logger.info("\nFailed operations:")
         for old_path, new_path, success, error in results:
             if not success:
-                logger.info(f"  {old_path.name} => {new_path.name}")
+                logger.info(f"  {os.path.basename(old_path)} => {os.path.basename(new_path)}")
                 logger.info(f"    Reason: {error}")
 
     logger.info("="*80 + "\n")
@@ -748,6 +1044,9 @@ Examples:
         logger.error("No valid entries found in CSV")
         sys.exit(1)
 
+    # Sanitize all titles up front
+    sanitized_titles = sanitize_titles(renaming_map, args.max_length)
+
     # Generate plan
     logger.info(f"Scanning directory: {args.directory}")
     if args.remove_suffix:
@@ -756,7 +1055,8 @@ Examples:
         logger.info("Mtime update enabled: Modification times will be updated to purchase dates")
     if args.include_renamed:
         logger.info("Include renamed mode: Will also search for already-renamed folders to process")
-    plan = generate_renaming_plan(args.directory, renaming_map, args.max_length, args.remove_suffix, args.update_mtime, args.include_renamed)
+    plan = list(generate_renaming_plan(args.directory, renaming_map, args.max_length, args.remove_suffix, args.update_mtime, args.include_renamed,
+                                       sanitized_titles=sanitized_titles))
     logger.info(f"Generated plan with {len(plan)} operations")
 
     if not plan:
@@ -773,7 +1073,7 @@ Examples:
         for target_name, sources in duplicates.items():
             logger.error(f"  {target_name}:")
             for source in sources:
-                logger.error(f"    - {source.name}")
+                logger.error(f"    - {os.path.basename(source)}")
         logger.error("Please resolve duplicates before proceeding")
         logger.error("This usually means multiple RJ numbers have the same title in the CSV")
         sys.exit(1)
@@ -8,16 +8,24 @@ and purchase dates. This is a standalone utility script for batch updates.
 No dependencies on dlsite_renamer.py - completely independent.
 """
 
+import atexit
 import csv
 import json
 import logging
 import os
+import queue
 import re
+import stat
 import sys
 import unicodedata
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterator, List, Tuple, Optional
 
 
 # ============================================================================
@@ -30,6 +38,10 @@ class Config:
     LOG_DIR = 'logs'
     DEFAULT_CSV = 'dlsite_purchases.csv'
 
+    # Parallel execution (rename/utime syscalls release the GIL)
+    MAX_WORKERS = 8
+    PARALLEL_THRESHOLD = 32  # Run sequentially below this many operations
+
     # Character replacements (full-width equivalents)
     CHAR_REPLACEMENTS = {
         '<': '＜',   # Full-width less than
@@ -44,6 +56,17 @@ class Config:
     }
 
 
+# Translation table for Config.CHAR_REPLACEMENTS (single pass in str.translate)
+_CHAR_TRANSLATION = str.maketrans(Config.CHAR_REPLACEMENTS)
+
+# "RJ番号[_タイトル][.partN]" folder names: group 1 = RJ number, group 2 = .partN suffix
+# (lazy title match so a trailing .partN is captured by group 2)
+_RJ_FULL_RE = re.compile(r'^(RJ\d+)(?:_.*?)?(\.part\d+)?$', re.IGNORECASE)
+
+# Folder names starting with an RJ number
+_RJ_PREFIX_RE = re.compile(r'^RJ\d+', re.IGNORECASE)
+
+
 # ============================================================================
 # Exceptions
 # ============================================================================
@@ -63,6 +86,38 @@ class TargetExistsError(RenamingError):
     pass
 
 
+# ============================================================================
+# Data Structures
+# ============================================================================
+
+@dataclass
+class UpdatePlan:
+    """
+    Update plan stored as parallel columns (old path, new path, timestamp)
+
+    Iterating yields (old_path, new_path, timestamp) tuples, so callers that
+    only need one column can read it directly without unpacking every entry.
+
+    Folders that are already up to date are not operations, but their paths
+    are kept in unchanged_paths so duplicate checks still see their names.
+    """
+    old_paths: List[str] = field(default_factory=list)
+    new_paths: List[str] = field(default_factory=list)
+    timestamps: List[Optional[float]] = field(default_factory=list)
+    unchanged_paths: List[str] = field(default_factory=list)
+
+    def append(self, old_path: str, new_path: str, timestamp: Optional[float]):
+        self.old_paths.append(old_path)
+        self.new_paths.append(new_path)
+        self.timestamps.append(timestamp)
+
+    def __len__(self) -> int:
+        return len(self.old_paths)
+
+    def __iter__(self) -> Iterator[Tuple[str, str, Optional[float]]]:
+        return zip(self.old_paths, self.new_paths, self.timestamps)
+
+
 # ============================================================================
 # Global Logger
 # ============================================================================
@@ -94,14 +149,19 @@ def setup_logging(log_dir: str = Config.LOG_DIR,
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     log_file = log_path / f'update_{timestamp}.log'
 
+    # File output runs on a background listener thread so that per-operation
+    # logging does not block the update loop. Console output stays synchronous
+    # so log lines keep their order relative to the preview and the prompt.
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, logging.FileHandler(log_file, encoding='utf-8'))
+    listener.start()
+    atexit.register(listener.stop)  # Flush remaining records on exit
+
     # Configure logging
     logging.basicConfig(
         level=level,
         format='%(asctime)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_file, encoding='utf-8'),
-            logging.StreamHandler()
-        ]
+        handlers=[QueueHandler(log_queue), logging.StreamHandler()]
     )
 
     new_logger = logging.getLogger(__name__)
@@ -123,21 +183,40 @@ def load_renaming_map(csv_path: Path) -> Dict[str, Tuple[str, Optional[str]]]:
     renaming_map = {}
 
     # Use 'utf-8-sig' to automatically handle BOM
-    with open(csv_path, 'r', encoding='utf-8-sig') as f:
-        reader = csv.DictReader(f)
+    # Large read buffer cuts read() syscalls; newline='' as required by the csv module
+    with open(csv_path, 'r', encoding='utf-8-sig', buffering=1024 * 1024, newline='') as f:
+        reader = csv.reader(f)
 
-        for row_num, row in enumerate(reader, start=2):  # Start at 2 (1 is header)
-            rj_number = row.get('rj_number', '').strip()
-            title = row.get('title', '').strip()
-            purchase_date = row.get('purchase_date', '').strip()
+        header = next(reader, None)
+        if header is None:
+            return renaming_map
 
-            # Validate data
-            if not rj_number:
-                logger.warning(f"Row {row_num}: Missing rj_number, skipping")
-                continue
-
-            if not title:
-                logger.warning(f"Row {row_num}: Missing title for {rj_number}, skipping")
+        # Resolve column positions once instead of building a dict per row
+        columns = {name: i for i, name in enumerate(header)}
+        try:
+            rj_index = columns['rj_number']
+            title_index = columns['title']
+        except KeyError as e:
+            raise ValueError(f"Missing required column in CSV header: {e}")
+        date_index = columns.get('purchase_date')
+        width = len(header)
+
+        # Blank lines are skipped (same as csv.DictReader)
+        for row_num, row in enumerate(filter(None, reader), start=2):  # Start at 2 (1 is header)
+            # Pad short rows so missing fields read as empty
+            if len(row) < width:
+                row += [''] * (width - len(row))
+
+            rj_number = row[rj_index].strip()
+            title = row[title_index].strip()
+            purchase_date = row[date_index].strip() if date_index is not None else ''
+
+            # Validate data (single check on the common path; messages formatted lazily)
+            if not (rj_number and title):
+                if not rj_number:
+                    logger.warning("Row %d: Missing rj_number, skipping", row_num)
+                else:
+                    logger.warning("Row %d: Missing title for %s, skipping", row_num, rj_number)
                 continue
 
             renaming_map[rj_number] = (title, purchase_date if purchase_date else None)
@@ -145,6 +224,7 @@ def load_renaming_map(csv_path: Path) -> Dict[str, Tuple[str, Optional[str]]]:
     return renaming_map
 
 
+@lru_cache(maxsize=8192)
 def sanitize_filename(title: str,
                      max_length: int = Config.MAX_FILENAME_LENGTH) -> str:
     """
@@ -166,14 +246,13 @@ def sanitize_filename(title: str,
     Raises:
         ValueError: If title becomes empty after sanitization
     """
-    sanitized = title
-
     # Replace forbidden characters
-    for char, replacement in Config.CHAR_REPLACEMENTS.items():
-        sanitized = sanitized.replace(char, replacement)
+    sanitized = title.translate(_CHAR_TRANSLATION)
 
     # Normalize Unicode (NFC form for compatibility)
-    sanitized = unicodedata.normalize('NFC', sanitized)
+    # ASCII is always NFC; otherwise the quick check avoids a full normalize
+    if not sanitized.isascii() and not unicodedata.is_normalized('NFC', sanitized):
+        sanitized = unicodedata.normalize('NFC', sanitized)
 
     # Remove leading/trailing whitespace
     sanitized = sanitized.strip()
@@ -192,6 +271,50 @@ def sanitize_filename(title: str,
     return sanitized
 
 
+@lru_cache(maxsize=None)
+def _day_ts(year: int, month: int, day: int) -> float:
+    """
+    Get Unix timestamp of local midnight for a calendar date
+
+    Args:
+        year: Year
+        month: Month
+        day: Day
+
+    Returns:
+        Unix timestamp for the date at 00:00:00
+    """
+    # timestamp() resolves the local timezone/DST via mktime; once per date
+    return datetime(year, month, day).timestamp()
+
+
+@lru_cache(maxsize=4096)
+def _purchase_date_to_timestamp(date_str: str) -> float:
+    """
+    Convert purchase date string to Unix timestamp (local midnight)
+
+    Args:
+        date_str: Date string in format "YYYY/MM/DD HH:MM"
+
+    Returns:
+        Unix timestamp for the date at 00:00:00
+
+    Raises:
+        ValueError: If date_str is not a valid date
+    """
+    # Fast path: slice the fixed-width format ("2019/01/21 21:56") directly
+    if (len(date_str) == 16 and date_str[4] == '/' and date_str[7] == '/'
+            and date_str[10] == ' ' and date_str[13] == ':'):
+        dt = datetime(int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]),
+                      int(date_str[11:13]), int(date_str[14:16]))
+    else:
+        # Non-padded variants (e.g. "2021/1/5 9:00") go through strptime
+        dt = datetime.strptime(date_str, '%Y/%m/%d %H:%M')
+
+    # Time is discarded (midnight); the timestamp is shared per calendar date
+    return _day_ts(dt.year, dt.month, dt.day)
+
+
 def parse_purchase_date(date_str: str) -> Optional[float]:
     """
     Parse purchase date from CSV and convert to Unix timestamp (midnight)
@@ -206,65 +329,66 @@ def parse_purchase_date(date_str: str) -> Optional[float]:
         return None
 
     try:
-        # Parse the date string (format: "2019/01/21 21:56")
-        dt = datetime.strptime(date_str, '%Y/%m/%d %H:%M')
-
-        # Set time to midnight (00:00:00)
-        dt_midnight = dt.replace(hour=0, minute=0, second=0, microsecond=0)
-
-        # Convert to Unix timestamp
-        timestamp = dt_midnight.timestamp()
-
-        return timestamp
+        # Many folders share a purchase date, so conversions are cached
+        return _purchase_date_to_timestamp(date_str)
     except ValueError as e:
         logger.warning(f"Failed to parse purchase date '{date_str}': {e}")
         return None
 
 
-def check_for_duplicates(plan: List[Tuple[Path, Path, Optional[float]]]) -> Dict[str, List[Path]]:
+def check_for_duplicates(plan: UpdatePlan) -> Dict[str, List[str]]:
     """
     Check for duplicate target names
 
     Args:
-        plan: List of (old_path, new_path, timestamp) tuples
+        plan: Update plan
 
     Returns:
         Dictionary of {target_name: [source_folders]} for duplicates
     """
-    targets = {}
+    # Up-to-date folders keep their name, so they still occupy it as a target
+    sources = plan.old_paths + plan.unchanged_paths
+    targets = plan.new_paths + plan.unchanged_paths
+
+    # Count first; source lists are only built for names that collide
+    target_names = [os.path.basename(target) for target in targets]
+    name_counts = Counter(target_names)
+    duplicate_names = {name for name, count in name_counts.items() if count > 1}
 
-    for source, target, _ in plan:
-        target_name = target.name
-        if target_name not in targets:
-            targets[target_name] = []
-        targets[target_name].append(source)
+    if not duplicate_names:
+        return {}
 
-    # Find duplicates
-    duplicates = {name: sources for name, sources in targets.items()
-                  if len(sources) > 1}
+    duplicates = defaultdict(list)
+    for source, target_name in zip(sources, target_names):
+        if target_name in duplicate_names:
+            duplicates[target_name].append(source)
 
-    return duplicates
+    return dict(duplicates)
 
 
-def preview_renaming(plan: List[Tuple[Path, Path, Optional[float]]],
+def preview_renaming(plan: UpdatePlan,
                     output_format: str = 'table'):
     """
     Display preview of renaming operations
 
     Args:
-        plan: List of (old_path, new_path, timestamp) tuples
+        plan: Update plan
         output_format: 'table' or 'json'
     """
     if output_format == 'table':
-        print("\n" + "="*80)
-        print("UPDATE PREVIEW")
-        print("="*80)
-        print(f"{'Old Name':<40} => {'New Name':<40}")
-        print("-"*80)
+        # Build the whole table and write it once instead of print() per row
+        lines = [
+            "",
+            "="*80,
+            "UPDATE PREVIEW",
+            "="*80,
+            f"{'Old Name':<40} => {'New Name':<40}",
+            "-"*80,
+        ]
 
-        for old_path, new_path, _ in plan:
-            old_name = old_path.name
-            new_name = new_path.name
+        for old_path, new_path in zip(plan.old_paths, plan.new_paths):
+            old_name = os.path.basename(old_path)
+            new_name = os.path.basename(new_path)
 
             # Truncate if too long for display
             if len(old_name) > 38:
@@ -272,27 +396,31 @@ def preview_renaming(plan: List[Tuple[Path, Path, Optional[float]]],
             if len(new_name) > 38:
                 new_name = new_name[:35] + "..."
 
-            print(f"{old_name:<40} => {new_name:<40}")
+            lines.append(f"{old_name:<40} => {new_name:<40}")
+
+        lines.append("="*80)
+        lines.append(f"Total operations: {len(plan)}")
+        lines.append("="*80 + "\n")
 
-        print("="*80)
-        print(f"Total operations: {len(plan)}")
-        print("="*80 + "\n")
+        sys.stdout.write("\n".join(lines) + "\n")
 
     elif output_format == 'json':
         preview = [
             {
-                'old': str(old_path),
-                'new': str(new_path),
-                'old_name': old_path.name,
-                'new_name': new_path.name,
+                'old': old_path,
+                'new': new_path,
+                'old_name': os.path.basename(old_path),
+                'new_name': os.path.basename(new_path),
                 'timestamp': timestamp
             }
             for old_path, new_path, timestamp in plan
         ]
-        print(json.dumps(preview, indent=2, ensure_ascii=False))
+        # Encode straight to stdout without building the full JSON string
+        json.dump(preview, sys.stdout, indent=2, ensure_ascii=False)
+        sys.stdout.write("\n")
 
 
-def log_operation(old_path: Path, new_path: Path, success: bool, error: Optional[str] = None):
+def log_operation(old_path: str, new_path: str, success: bool, error: Optional[str] = None):
     """
     Log individual update operation
 
@@ -302,26 +430,35 @@ def log_operation(old_path: Path, new_path: Path, success: bool, error: Optional
         success: Whether operation succeeded
         error: Error message if failed
     """
+    # %-style arguments: messages are only formatted if a handler emits them
     if success:
         if old_path == new_path:
-            logger.info(f"SUCCESS (mtime only): {old_path.name}")
+            logger.info("SUCCESS (mtime only): %s", os.path.basename(old_path))
         else:
-            logger.info(f"SUCCESS: {old_path.name} => {new_path.name}")
+            logger.info("SUCCESS: %s => %s", os.path.basename(old_path), os.path.basename(new_path))
     else:
-        logger.error(f"FAILED: {old_path.name} => {new_path.name}")
+        logger.error("FAILED: %s => %s", os.path.basename(old_path), os.path.basename(new_path))
         if error:
-            logger.error(f"  Error: {error}")
+            logger.error("  Error: %s", error)
 
 
-def generate_summary_report(results: List[Tuple[Path, Path, bool, Optional[str]]]):
+def generate_summary_report(results: List[Tuple[str, str, bool, Optional[str]]]):
     """
     Generate summary report after execution
 
     Args:
         results: List of (old_path, new_path, success, error) tuples
     """
+    # Single pass: count successes and keep the (usually few) failures
+    successful = 0
+    failures = []
+    for old_path, new_path, success, error in results:
+        if success:
+            successful += 1
+        else:
+            failures.append((old_path, new_path, error))
+
     total = len(results)
-    successful = sum(1 for _, _, success, _ in results if success)
     failed = total - successful
 
     logger.info("\n" + "="*80)
@@ -331,12 +468,11 @@ def generate_summary_report(results: List[Tuple[Path, Path, bool, Optional[str]]
     logger.info(f"Successful: {successful}")
     logger.info(f"Failed: {failed}")
 
-    if failed > 0:
+    if failures:
         logger.info("\nFailed operations:")
-        for old_path, new_path, success, error in results:
-            if not success:
-                logger.info(f"  {old_path.name} => {new_path.name}")
-                logger.info(f"    Reason: {error}")
+        for old_path, new_path, error in failures:
+            logger.info(f"  {os.path.basename(old_path)} => {os.path.basename(new_path)}")
+            logger.info(f"    Reason: {error}")
 
     logger.info("="*80 + "\n")
 
@@ -369,8 +505,7 @@ def extract_rj_number_from_folder(folder_name: str) -> Optional[str]:
         None
     """
     # Pattern: RJ + digits at start, optionally followed by underscore/content and .partN
-    pattern = re.compile(r'^(RJ\d+)(?:_.*)?(?:\.part\d+)?$', re.IGNORECASE)
-    match = pattern.match(folder_name)
+    match = _RJ_FULL_RE.match(folder_name)
 
     if match:
         return match.group(1).upper()  # Normalize to uppercase
@@ -380,7 +515,7 @@ def extract_rj_number_from_folder(folder_name: str) -> Optional[str]:
 
 def generate_update_plan(base_dir: Path,
                          renaming_map: Dict[str, Tuple[str, Optional[str]]],
-                         max_length: int = Config.MAX_FILENAME_LENGTH) -> List[Tuple[Path, Path, Optional[float]]]:
+                         max_length: int = Config.MAX_FILENAME_LENGTH) -> UpdatePlan:
     """
     Generate update plan for already-renamed folders
 
@@ -390,82 +525,100 @@ def generate_update_plan(base_dir: Path,
         max_length: Maximum filename length
 
     Returns:
-        List of (old_path, new_path, timestamp) tuples
+        Update plan of (old_path, new_path, timestamp) entries
     """
-    plan = []
+    plan = UpdatePlan()
     not_found = []
     sanitization_errors = []
     invalid_format = []
 
-    # Build folder cache (performance optimization)
-    logger.debug("Building folder cache...")
-    folder_cache = {}
-    if base_dir.exists():
-        for item in base_dir.iterdir():
-            if item.is_dir():
-                folder_cache[item.name] = item
-    else:
+    if not base_dir.exists():
         logger.error(f"Base directory does not exist: {base_dir}")
-        return []
-    logger.debug(f"Cached {len(folder_cache)} folders")
-
-    # Filter folders matching RJ番号_* pattern (or just RJ番号)
-    rj_pattern = re.compile(r'^RJ\d+', re.IGNORECASE)
-    rj_folders = {
-        name: path
-        for name, path in folder_cache.items()
-        if rj_pattern.match(name)
-    }
-    logger.info(f"Found {len(rj_folders)} folders with RJ numbers")
+        return plan
+
+    rj_folder_count = 0
+
+    # Plan entries are plain path strings; join against the parent once per item
+    parent_str = os.fspath(base_dir)
+
+    # Bind hot-loop lookups to locals once instead of per folder
+    prefix_match = _RJ_PREFIX_RE.match
+    full_match = _RJ_FULL_RE.match
+    rmap_get = renaming_map.get
+    sanitize = sanitize_filename
+    parse_date = parse_purchase_date
+    path_join = os.path.join
+    plan_append = plan.append
+    unchanged_append = plan.unchanged_paths.append
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
+    # Single directory pass: filter, extract RJ number and build the plan
+    # DirEntry.is_dir() uses the cached file type, so no extra stat per entry
+    with os.scandir(base_dir) as entries:
+        for entry in entries:
+            folder_name = entry.name
+
+            # Filter folders matching RJ番号_* pattern (or just RJ番号)
+            if not prefix_match(folder_name) or not entry.is_dir():
+                continue
+            rj_folder_count += 1
 
-    # Process each folder
-    for folder_name, folder_path in rj_folders.items():
-        # Extract RJ number
-        rj_number = extract_rj_number_from_folder(folder_name)
+            # Extract RJ number and .partN suffix with a single match
+            match = full_match(folder_name)
 
-        if not rj_number:
-            logger.warning(f"Could not extract RJ number from: {folder_name}")
-            invalid_format.append(folder_name)
-            continue
+            if not match:
+                logger.warning(f"Could not extract RJ number from: {folder_name}")
+                invalid_format.append(folder_name)
+                continue
 
-        # Look up in CSV
-        if rj_number not in renaming_map:
-            logger.debug(f"RJ number not in CSV: {rj_number}")
-            not_found.append(rj_number)
-            continue
+            rj_number = match.group(1).upper()  # Normalize to uppercase
+            suffix = match.group(2)
 
-        title, purchase_date = renaming_map[rj_number]
+            # Look up in CSV (single dict probe)
+            csv_entry = rmap_get(rj_number)
+            if csv_entry is None:
+                if debug_enabled:
+                    logger.debug("RJ number not in CSV: %s", rj_number)
+                not_found.append(rj_number)
+                continue
 
-        # Sanitize title
-        try:
-            sanitized_title = sanitize_filename(title, max_length)
-        except ValueError as e:
-            logger.error(f"Failed to sanitize title for {rj_number}: {e}")
-            sanitization_errors.append(rj_number)
-            continue
-
-        # Parse purchase date
-        timestamp = parse_purchase_date(purchase_date) if purchase_date else None
-
-        # Extract .partN suffix if present
-        suffix_match = re.search(r'(\.part\d+)$', folder_name, re.IGNORECASE)
-        suffix = suffix_match.group(1) if suffix_match else None
-
-        # Generate new name: RJ番号_新タイトル[.partN]
-        if suffix:
-            new_name = f"{rj_number}_{sanitized_title}{suffix}"
-        else:
-            new_name = f"{rj_number}_{sanitized_title}"
+            title, purchase_date = csv_entry
+
+            # Sanitize title
+            try:
+                sanitized_title = sanitize(title, max_length)
+            except ValueError as e:
+                logger.error(f"Failed to sanitize title for {rj_number}: {e}")
+                sanitization_errors.append(rj_number)
+                continue
+
+            # Parse purchase date
+            timestamp = parse_date(purchase_date) if purchase_date else None
+
+            # Generate new name: RJ番号_新タイトル[.partN]
+            if suffix:
+                new_name = f"{rj_number}_{sanitized_title}{suffix}"
+            else:
+                new_name = f"{rj_number}_{sanitized_title}"
 
-        new_path = folder_path.parent / new_name
+            # Skip no-op entries: name already up to date and no mtime to set
+            # (kept aside so check_for_duplicates still counts the name)
+            if new_name == folder_name and timestamp is None:
+                unchanged_append(entry.path)
+                continue
+
+            # Add to plan
+            plan_append(entry.path, path_join(parent_str, new_name), timestamp)
 
-        # Add to plan
-        plan.append((folder_path, new_path, timestamp))
+    logger.info(f"Found {rj_folder_count} folders with RJ numbers")
 
     # Report summary
     if not_found:
         logger.info(f"RJ numbers not in CSV: {len(not_found)} (normal if CSV is not complete)")
 
+    if plan.unchanged_paths:
+        logger.info(f"Already up to date (no purchase date to apply): {len(plan.unchanged_paths)} folders")
+
     if invalid_format:
         logger.warning(f"Invalid folder format: {len(invalid_format)} folders")
 
@@ -475,71 +628,114 @@ def generate_update_plan(base_dir: Path,
     return plan
 
 
-def execute_update(plan: List[Tuple[Path, Path, Optional[float]]],
-                   dry_run: bool = False) -> List[Tuple[Path, Path, bool, Optional[str]]]:
+def _execute_one(old_path: str,
+                 new_path: str,
+                 timestamp: Optional[float],
+                 dry_run: bool,
+                 parent_writable: Dict[str, bool]) -> Tuple[str, str, bool, Optional[str]]:
     """
-    Execute update operations (rename + mtime update)
+    Execute a single update operation (rename + mtime update)
 
     Args:
-        plan: List of (old_path, new_path, timestamp) tuples
+        old_path: Original path
+        new_path: New path
+        timestamp: Purchase date timestamp (or None)
         dry_run: If True, don't actually execute
+        parent_writable: Shared cache of directory -> write permission
 
     Returns:
-        List of (old_path, new_path, success, error) tuples
+        (old_path, new_path, success, error) tuple
     """
-    results = []
-
-    for old_path, new_path, timestamp in plan:
+    try:
+        # Validation checks (one stat call for existence and type)
         try:
-            # Validation checks
-            if not old_path.exists():
-                raise FolderNotFoundError(f"Source not found: {old_path}")
+            source_stat = os.stat(old_path)
+        except FileNotFoundError:
+            raise FolderNotFoundError(f"Source not found: {old_path}")
+
+        if not stat.S_ISDIR(source_stat.st_mode):
+            raise RenamingError(f"Not a directory: {old_path}")
+
+        # Check if this is just a mtime update (no rename needed)
+        is_mtime_only = (old_path == new_path)
+
+        if not is_mtime_only and os.path.exists(new_path):
+            raise TargetExistsError(f"Target already exists: {new_path}")
+
+        # Check parent directory is writable (only if renaming)
+        # All folders usually share one parent, so check each directory once
+        if not is_mtime_only:
+            parent = os.path.dirname(old_path) or os.curdir
+            writable = parent_writable.get(parent)
+            if writable is None:
+                writable = parent_writable[parent] = os.access(parent, os.W_OK)
+            if not writable:
+                raise PermissionError(f"No write permission: {parent}")
+
+        # Execute rename and mtime update
+        if not dry_run:
+            # Rename if needed
+            if not is_mtime_only:
+                os.rename(old_path, new_path)
+
+                # Verify
+                if not os.path.exists(new_path):
+                    raise RenamingError("Verification failed: target not found after rename")
+
+            # Update modification time (always, if timestamp available)
+            # For mtime-only operations, update the old_path directly
+            target_path = new_path if not is_mtime_only else old_path
+            if timestamp is not None:
+                try:
+                    # Set both access time and modification time to the same timestamp
+                    os.utime(target_path, (timestamp, timestamp))
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Updated mtime for %s to %s", os.path.basename(target_path),
+                                     datetime.fromtimestamp(timestamp).strftime('%Y-%m-%d'))
+                except Exception as e:
+                    logger.warning(f"Failed to update mtime for {os.path.basename(target_path)}: {e}")
+
+        # Log success
+        log_operation(old_path, new_path, True)
+        return old_path, new_path, True, None
 
-            if not old_path.is_dir():
-                raise RenamingError(f"Not a directory: {old_path}")
-
-            # Check if this is just a mtime update (no rename needed)
-            is_mtime_only = (old_path == new_path)
+    except Exception as e:
+        # Log failure
+        error_msg = str(e)
+        log_operation(old_path, new_path, False, error_msg)
+        return old_path, new_path, False, error_msg
 
-            if not is_mtime_only and new_path.exists():
-                raise TargetExistsError(f"Target already exists: {new_path}")
 
-            # Check parent directory is writable (only if renaming)
-            if not is_mtime_only and not os.access(old_path.parent, os.W_OK):
-                raise PermissionError(f"No write permission: {old_path.parent}")
+def execute_update(plan: UpdatePlan,
+                   dry_run: bool = False,
+                   workers: int = Config.MAX_WORKERS) -> List[Tuple[str, str, bool, Optional[str]]]:
+    """
+    Execute update operations (rename + mtime update)
 
-            # Execute rename and mtime update
-            if not dry_run:
-                # Rename if needed
-                if not is_mtime_only:
-                    old_path.rename(new_path)
+    Large plans are run on a thread pool: rename/utime are blocking
+    syscalls that release the GIL, so their latency (notably on NAS/SMB)
+    overlaps across workers. Results keep the plan order.
 
-                    # Verify
-                    if not new_path.exists():
-                        raise RenamingError("Verification failed: target not found after rename")
+    Args:
+        plan: Update plan
+        dry_run: If True, don't actually execute
+        workers: Number of worker threads (1 = sequential)
 
-                # Update modification time (always, if timestamp available)
-                # For mtime-only operations, update the old_path directly
-                target_path = new_path if not is_mtime_only else old_path
-                if timestamp is not None:
-                    try:
-                        # Set both access time and modification time to the same timestamp
-                        os.utime(target_path, (timestamp, timestamp))
-                        logger.debug(f"Updated mtime for {target_path.name} to {datetime.fromtimestamp(timestamp).strftime('%Y-%m-%d')}")
-                    except Exception as e:
-                        logger.warning(f"Failed to update mtime for {target_path.name}: {e}")
+    Returns:
+        List of (old_path, new_path, success, error) tuples
+    """
+    parent_writable = {}
 
-            # Log success
-            log_operation(old_path, new_path, True)
-            results.append((old_path, new_path, True, None))
+    def run(old_path: str, new_path: str,
+            timestamp: Optional[float]) -> Tuple[str, str, bool, Optional[str]]:
+        return _execute_one(old_path, new_path, timestamp, dry_run, parent_writable)
 
-        except Exception as e:
-            # Log failure
-            error_msg = str(e)
-            log_operation(old_path, new_path, False, error_msg)
-            results.append((old_path, new_path, False, error_msg))
+    # Thread startup is not worth it for small plans
+    if workers <= 1 or len(plan) < Config.PARALLEL_THRESHOLD:
+        return list(map(run, plan.old_paths, plan.new_paths, plan.timestamps))
 
-    return results
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(run, plan.old_paths, plan.new_paths, plan.timestamps))
 
 
 # ============================================================================
@@ -608,9 +804,18 @@ Examples:
         default=Config.MAX_FILENAME_LENGTH,
         help=f'Maximum filename length (default: {Config.MAX_FILENAME_LENGTH})'
     )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=Config.MAX_WORKERS,
+        help=f'Number of parallel worker threads for updates (default: {Config.MAX_WORKERS})'
+    )
 
     args = parser.parse_args()
 
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+
     # Setup logging
     global logger
     logger = setup_logging(args.log_dir)
@@ -665,7 +870,7 @@ Examples:
         for target_name, sources in duplicates.items():
             logger.error(f"  {target_name}:")
             for source in sources:
-                logger.error(f"    - {source.name}")
+                logger.error(f"    - {os.path.basename(source)}")
         logger.error("Please resolve duplicates before proceeding")
         logger.error("This usually means multiple RJ numbers have the same title in the CSV")
         sys.exit(1)
@@ -689,7 +894,7 @@ Examples:
     # Execute
     logger.info("Executing update operations...")
     logger.info("Modification times will be updated to purchase dates (00:00:00)")
-    results = execute_update(plan, dry_run=False)
+    results = execute_update(plan, dry_run=False, workers=args.workers)
 
     # Summary
     generate_summary_report(results)